@@ -1,3 +1,5 @@
+import json
+import os
 import yfinance as yf
 import streamlit as st
 import pandas as pd
@@ -80,88 +82,99 @@ def generate_signals(data, ticker_name):
     
     return signals
 
-# Define assets by category
-commodities = {
-    'GC=F': {'name': 'Gold', 'emoji': '🥇', 'unit': 'USD/oz'},
-    'SI=F': {'name': 'Silver', 'emoji': '🥈', 'unit': 'USD/oz'},
-    'HG=F': {'name': 'Copper', 'emoji': '🔶', 'unit': 'USD/lb'}
-}
+# Asset registry: category -> ticker -> name, emoji, unit, exchange, currency
+ASSET_REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets.json")
+ASSETS_PER_PAGE = 8
 
-etfs = {
-    'AIQ': {'name': 'Global X AI & Tech ETF', 'emoji': '🤖', 'unit': 'USD/share'},
-    'SMH': {'name': 'VanEck Semiconductors', 'emoji': '💾', 'unit': 'USD/share'}
-}
+REQUIRED_ASSET_KEYS = ('name', 'emoji', 'unit', 'exchange', 'currency')
 
-asian_markets = {
-    '^KS11': {'name': 'South Korea KOSPI', 'emoji': '🇰🇷', 'unit': 'KOSPI'},
-    '^TWII': {'name': 'Taiwan Weighted', 'emoji': '🇹🇼', 'unit': 'TWII'},
-    '^JKSE': {'name': 'Jakarta Stock Exchange', 'emoji': '🇮🇩', 'unit': 'IDX'}
-}
+def registry_error(message):
+    """Show an asset registry problem and stop rendering"""
+    st.error(f"❌ Asset registry: {message}")
+    st.stop()
 
-# Combine all tickers
-all_assets = {**commodities, **etfs, **asian_markets}
-tickers = list(all_assets.keys())
+def load_asset_registry(path=ASSET_REGISTRY_PATH):
+    """Load the asset registry, tagging each asset with its category"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            registry = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        registry_error(f"could not load {path} ({e})")
+    if not isinstance(registry, dict):
+        registry_error("must map category names to assets")
+    seen_tickers = {}
+    for category, assets in registry.items():
+        if not isinstance(assets, dict):
+            registry_error(f"category '{category}' must map tickers to asset entries")
+        for ticker, info in assets.items():
+            if not isinstance(info, dict):
+                registry_error(f"entry '{ticker}' ({category}) must be an object")
+            missing = [key for key in REQUIRED_ASSET_KEYS if key not in info]
+            if missing:
+                registry_error(f"entry '{ticker}' ({category}) is missing: {', '.join(missing)}")
+            if ticker in seen_tickers:
+                registry_error(f"ticker '{ticker}' is listed in both {seen_tickers[ticker]} and {category}")
+            seen_tickers[ticker] = category
+    return {
+        category: {ticker: {**info, 'category': category} for ticker, info in assets.items()}
+        for category, assets in registry.items()
+    }
+
+QUOTE_TTL_SECONDS = 60
+
+@st.cache_data(ttl=QUOTE_TTL_SECONDS, show_spinner=False)
+def fetch_quotes(tickers):
+    """Download the latest 5-day quotes for one shard of tickers (short-lived cache)"""
+    return yf.download(list(tickers), period="5d", progress=False)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_prices(tickers, period):
+    """Download price history for one shard of tickers (cached per shard and period)"""
+    return yf.download(list(tickers), period=period, progress=False)
+
+def price_prefix(info):
+    """Currency symbol shown before prices"""
+    return '$' if info['currency'] == 'USD' else ''
+
+registry = load_asset_registry()
+
+# Only the selected categories and page are fetched and computed
+selected_categories = st.sidebar.multiselect("Categories", list(registry.keys()), default=list(registry.keys()))
+selected_assets = {ticker: info for category in selected_categories for ticker, info in registry[category].items()}
+if not selected_assets:
+    st.info("Select at least one category.")
+    st.stop()
+
+num_pages = -(-len(selected_assets) // ASSETS_PER_PAGE)
+page = 1
+if num_pages > 1:
+    page = st.sidebar.number_input(f"Page (of {num_pages})", min_value=1, max_value=num_pages, value=1, step=1)
+
+all_assets = dict(list(selected_assets.items())[(page - 1) * ASSETS_PER_PAGE:page * ASSETS_PER_PAGE])
+tickers = tuple(all_assets.keys())
 
 # Fetch current data
 with st.spinner('Fetching latest prices...'):
-    current_data = yf.download(tickers, period="5d", progress=False)
+    current_data = fetch_quotes(tickers)
 
 # Display all assets in one compact section
 st.subheader("💎 Market Overview")
+st.caption(f"Quotes may be up to {QUOTE_TTL_SECONDS} seconds old; press Refresh Prices for the latest.")
 
-# Create columns for all assets (3 commodities + 2 ETFs + 3 Asian = 8 total)
-all_cols = st.columns(8)
-
-# Commodities
-for idx, ticker in enumerate(commodities.keys()):
-    with all_cols[idx]:
-        info = commodities[ticker]
+all_cols = st.columns(ASSETS_PER_PAGE)
+for col, ticker in zip(all_cols, tickers):
+    with col:
+        info = all_assets[ticker]
         
         current_price = current_data['Close'][ticker].iloc[-1]
         prev_price = current_data['Close'][ticker].iloc[-2]
         change = current_price - prev_price
         change_pct = (change / prev_price) * 100
         
-        st.markdown(f"<p style='font-size:12px; margin:0;'><strong>{info['emoji']} {info['name']}</strong></p>", unsafe_allow_html=True)
+        st.markdown(f"<p style='font-size:12px; margin:0;'><strong>{info['emoji']} {info['name']}</strong> <span style='color:gray;'>{info['exchange']}</span></p>", unsafe_allow_html=True)
         st.metric(
             label=info['unit'],
-            value=f"${current_price:.2f}",
-            delta=f"{change_pct:+.1f}%",
-            label_visibility="collapsed"
-        )
-
-# ETFs
-for idx, ticker in enumerate(etfs.keys()):
-    with all_cols[idx + 3]:
-        info = etfs[ticker]
-        
-        current_price = current_data['Close'][ticker].iloc[-1]
-        prev_price = current_data['Close'][ticker].iloc[-2]
-        change = current_price - prev_price
-        change_pct = (change / prev_price) * 100
-        
-        st.markdown(f"<p style='font-size:12px; margin:0;'><strong>{info['emoji']} {info['name']}</strong></p>", unsafe_allow_html=True)
-        st.metric(
-            label=info['unit'],
-            value=f"${current_price:.2f}",
-            delta=f"{change_pct:+.1f}%",
-            label_visibility="collapsed"
-        )
-
-# Asian Markets
-for idx, ticker in enumerate(asian_markets.keys()):
-    with all_cols[idx + 5]:
-        info = asian_markets[ticker]
-        
-        current_price = current_data['Close'][ticker].iloc[-1]
-        prev_price = current_data['Close'][ticker].iloc[-2]
-        change = current_price - prev_price
-        change_pct = (change / prev_price) * 100
-        
-        st.markdown(f"<p style='font-size:12px; margin:0;'><strong>{info['emoji']} {info['name']}</strong></p>", unsafe_allow_html=True)
-        st.metric(
-            label=info['unit'],
-            value=f"{current_price:.2f}",
+            value=f"{price_prefix(info)}{current_price:.2f}",
             delta=f"{change_pct:+.1f}%",
             label_visibility="collapsed"
         )
@@ -172,10 +185,10 @@ st.subheader("📊 Detailed Price Data")
 
 # Fetch additional historical data for comparisons with more buffer
 with st.spinner('Fetching historical data...'):
-    hist_1m = yf.download(tickers, period="2mo", progress=False)
-    hist_3m = yf.download(tickers, period="6mo", progress=False)
-    hist_ytd = yf.download(tickers, period="ytd", progress=False)
-    hist_1y = yf.download(tickers, period="2y", progress=False)
+    hist_1m = fetch_prices(tickers, "2mo")
+    hist_3m = fetch_prices(tickers, "6mo")
+    hist_ytd = fetch_prices(tickers, "ytd")
+    hist_1y = fetch_prices(tickers, "2y")
 
 display_data = pd.DataFrame()
 
@@ -233,7 +246,7 @@ for ticker in tickers:
     except:
         yoy_change = 0
     
-    display_data[all_assets[ticker]['name']] = [
+    display_data[ticker] = [
         current_price,
         change_pct,
         wow_change,
@@ -246,76 +259,45 @@ for ticker in tickers:
 display_data.index = ['Current Price', 'Change (%)', 'WoW %', 'MoM %', 'QoQ %', 'YTD %', 'YoY %']
 
 # Style and display the table with gradient colors
-def get_color_gradient(val):
-    """Get color based on value with gradient effect - full spectrum every 5%"""
-    if val >= 50:
-        return '#004d00'  # Darkest green
-    elif val >= 45:
-        return '#005a00'
-    elif val >= 40:
-        return '#006600'
-    elif val >= 35:
-        return '#007300'
-    elif val >= 30:
-        return '#008000'  # Green
-    elif val >= 25:
-        return '#009900'
-    elif val >= 20:
-        return '#00b300'
-    elif val >= 15:
-        return '#00cc00'
-    elif val >= 10:
-        return '#00e600'
-    elif val >= 5:
-        return '#00ff00'  # Bright green
-    elif val > 0:
-        return '#90EE90'  # Light green
-    elif val == 0:
-        return '#e0e0e0'  # Light gray
-    elif val > -5:
-        return '#ffcccc'  # Light red
-    elif val > -10:
-        return '#ff9999'
-    elif val > -15:
-        return '#ff6666'
-    elif val > -20:
-        return '#ff3333'
-    elif val > -25:
-        return '#ff0000'  # Bright red
-    elif val > -30:
-        return '#e60000'
-    elif val > -35:
-        return '#cc0000'
-    elif val > -40:
-        return '#b30000'
-    elif val > -45:
-        return '#990000'
-    elif val > -50:
-        return '#800000'
-    else:
-        return '#660000'  # Darkest red
-
-def style_value(val, row_name):
+# Full spectrum every 5%: gains bin on [edge, next), losses on (edge, next]
+GAIN_EDGES = np.arange(5, 55, 5)
+GAIN_COLORS = np.array(['#90EE90', '#00ff00', '#00e600', '#00cc00', '#00b300', '#009900',
+                        '#008000', '#007300', '#006600', '#005a00', '#004d00'])
+LOSS_EDGES = np.arange(-50, 0, 5)
+LOSS_COLORS = np.array(['#660000', '#800000', '#990000', '#b30000', '#cc0000', '#e60000',
+                        '#ff0000', '#ff3333', '#ff6666', '#ff9999', '#ffcccc'])
+FLAT_COLOR = '#e0e0e0'
+
+def get_color_gradient(values):
+    """Map an array of % changes to heat-map colors in one binning pass"""
+    values = np.asarray(values, dtype=float)
+    gain = GAIN_COLORS[np.searchsorted(GAIN_EDGES, values, side='right').clip(0, len(GAIN_COLORS) - 1)]
+    loss = LOSS_COLORS[np.searchsorted(LOSS_EDGES, values, side='left').clip(0, len(LOSS_COLORS) - 1)]
+    return np.where(values > 0, gain, np.where(values < 0, loss, FLAT_COLOR))
+
+def style_row(values, row_name, price_prefixes):
+    """Format one table row of values as HTML cells"""
     if row_name == 'Current Price':
-        return f'${val:.2f}'
-    else:
-        color = get_color_gradient(val)
-        text_color = 'white' if abs(val) >= 5 else 'black'
-        return f'<span style="background-color: {color}; color: {text_color}; padding: 2px 8px; border-radius: 4px; font-weight: bold;">{val:+.2f}%</span>'
-
-# Create HTML table
-html_rows = []
-for idx in display_data.index:
-    row_html = f'<tr><td style="font-weight: bold; padding: 8px;">{idx}</td>'
-    for col in display_data.columns:
-        val = display_data.at[idx, col]
-        styled_val = style_value(val, idx)
-        row_html += f'<td style="padding: 8px; text-align: center;">{styled_val}</td>'
-    row_html += '</tr>'
-    html_rows.append(row_html)
-
-header_html = '<tr style="background-color: #f0f0f0;"><th style="padding: 8px;"></th>' + ''.join([f'<th style="padding: 8px; text-align: center;">{col}</th>' for col in display_data.columns]) + '</tr>'
-table_html = f'''
+        return [f'{prefix}{val:.2f}' for prefix, val in zip(price_prefixes, values)]
+    colors = get_color_gradient(values)
+    text_colors = np.where(np.abs(values) >= 5, 'white', 'black')
+    return [
+        f'<span style="background-color: {color}; color: {text_color}; padding: 2px 8px; border-radius: 4px; font-weight: bold;">{val:+.2f}%</span>'
+        for val, color, text_color in zip(values, colors, text_colors)
+    ]
+
+@st.cache_data(ttl=QUOTE_TTL_SECONDS, max_entries=64, show_spinner=False)
+def render_heatmap_table(table_data, column_labels, price_prefixes):
+    """Build the heat-map table HTML (cached on a hash of the data)"""
+    header_html = '<tr style="background-color: #f0f0f0;"><th style="padding: 8px;"></th>' + ''.join(
+        f'<th style="padding: 8px; text-align: center;">{label}</th>' for label in column_labels) + '</tr>'
+    html_rows = [
+        f'<tr><td style="font-weight: bold; padding: 8px;">{row_name}</td>'
+        + ''.join(f'<td style="padding: 8px; text-align: center;">{cell}</td>' for cell in style_row(values, row_name, price_prefixes))
+        + '</tr>'
+        for row_name, values in zip(table_data.index, table_data.to_numpy(dtype=float))
+    ]
+    return f'''
 <style>
     table {{
         width: 100%;
@@ -340,14 +322,19 @@ table_html = f'''
 </table>
 '''
 
-st.markdown(table_html, unsafe_allow_html=True)
+# The asset pager caps the table at ASSETS_PER_PAGE columns, so it needs no pager of its own
+assert len(display_data.columns) <= ASSETS_PER_PAGE
+# Columns are keyed by ticker so assets sharing a display name keep their own column
+column_labels = tuple(all_assets[ticker]['name'] for ticker in display_data.columns)
+price_prefixes = tuple(price_prefix(all_assets[ticker]) for ticker in display_data.columns)
+st.markdown(render_heatmap_table(display_data, column_labels, price_prefixes), unsafe_allow_html=True)
 
 # Technical Analysis Section
 st.markdown("---")
 st.subheader("📈 Technical Analysis & Signals (Last 2 Years)")
 
 with st.spinner('Calculating technical indicators...'):
-    trend_data = yf.download(tickers, period="2y", progress=False)
+    trend_data = fetch_prices(tickers, "2y")
     
     # Calculate indicators for each ticker
     technical_data = {}
@@ -364,155 +351,64 @@ with st.spinner('Calculating technical indicators...'):
         
         technical_data[ticker] = df
 
-# Commodities trends with indicators
-st.markdown("**Commodities**")
-for ticker in commodities.keys():
-    info = commodities[ticker]
-    data = technical_data[ticker]
-    
-    # Generate signals
-    signals = generate_signals(data, info['name'])
-    
-    # Create subplot with price and RSI
-    fig = make_subplots(
-        rows=2, cols=1,
-        row_heights=[0.7, 0.3],
-        subplot_titles=(f"{info['emoji']} {info['name']}", "RSI"),
-        vertical_spacing=0.1
-    )
-    
-    # Price chart with Bollinger Bands
-    fig.add_trace(go.Scatter(x=data.index, y=data['BB_upper'], 
-                             name='BB Upper', line=dict(color='rgba(250,128,114,0.3)', width=1),
-                             showlegend=False), row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['BB_lower'], 
-                             name='BB Lower', line=dict(color='rgba(250,128,114,0.3)', width=1),
-                             fill='tonexty', fillcolor='rgba(250,128,114,0.1)',
-                             showlegend=False), row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['Close'], 
-                             name='Price', line=dict(color='#00D9FF', width=2)), row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['SMA_20'], 
-                             name='SMA 20', line=dict(color='orange', width=1, dash='dash')), row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['SMA_50'], 
-                             name='SMA 50', line=dict(color='red', width=1, dash='dash')), row=1, col=1)
-    
-    # RSI
-    fig.add_trace(go.Scatter(x=data.index, y=data['RSI'], 
-                             name='RSI', line=dict(color='purple', width=2)), row=2, col=1)
-    fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5, row=2, col=1)
-    fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=2, col=1)
-    
-    fig.update_layout(height=500, hovermode='x unified', showlegend=True)
-    fig.update_xaxes(showgrid=False)
-    fig.update_yaxes(title_text=info['unit'], row=1, col=1)
-    fig.update_yaxes(title_text="RSI", row=2, col=1)
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Display signals
-    st.markdown("**Trading Signals:**")
-    for signal in signals:
-        st.markdown(f"- {signal}")
-    st.markdown("---")
-
-# ETFs trends with indicators
-st.markdown("**ETFs**")
-for ticker in etfs.keys():
-    info = etfs[ticker]
-    data = technical_data[ticker]
-    
-    signals = generate_signals(data, info['name'])
-    
-    fig = make_subplots(
-        rows=2, cols=1,
-        row_heights=[0.7, 0.3],
-        subplot_titles=(f"{info['emoji']} {info['name']}", "RSI"),
-        vertical_spacing=0.1
-    )
-    
-    fig.add_trace(go.Scatter(x=data.index, y=data['BB_upper'], 
-                             name='BB Upper', line=dict(color='rgba(250,128,114,0.3)', width=1),
-                             showlegend=False), row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['BB_lower'], 
-                             name='BB Lower', line=dict(color='rgba(250,128,114,0.3)', width=1),
-                             fill='tonexty', fillcolor='rgba(250,128,114,0.1)',
-                             showlegend=False), row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['Close'], 
-                             name='Price', line=dict(color='#00D9FF', width=2)), row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['SMA_20'], 
-                             name='SMA 20', line=dict(color='orange', width=1, dash='dash')), row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['SMA_50'], 
-                             name='SMA 50', line=dict(color='red', width=1, dash='dash')), row=1, col=1)
-    
-    fig.add_trace(go.Scatter(x=data.index, y=data['RSI'], 
-                             name='RSI', line=dict(color='purple', width=2)), row=2, col=1)
-    fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5, row=2, col=1)
-    fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=2, col=1)
-    
-    fig.update_layout(height=500, hovermode='x unified', showlegend=True)
-    fig.update_xaxes(showgrid=False)
-    fig.update_yaxes(title_text=info['unit'], row=1, col=1)
-    fig.update_yaxes(title_text="RSI", row=2, col=1)
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("**Trading Signals:**")
-    for signal in signals:
-        st.markdown(f"- {signal}")
-    st.markdown("---")
-
-# Asian Markets trends with indicators
-st.markdown("**Asian Markets**")
-for ticker in asian_markets.keys():
-    info = asian_markets[ticker]
-    data = technical_data[ticker]
-    
-    signals = generate_signals(data, info['name'])
-    
-    fig = make_subplots(
-        rows=2, cols=1,
-        row_heights=[0.7, 0.3],
-        subplot_titles=(f"{info['emoji']} {info['name']}", "RSI"),
-        vertical_spacing=0.1
-    )
-    
-    fig.add_trace(go.Scatter(x=data.index, y=data['BB_upper'], 
-                             name='BB Upper', line=dict(color='rgba(250,128,114,0.3)', width=1),
-                             showlegend=False), row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['BB_lower'], 
-                             name='BB Lower', line=dict(color='rgba(250,128,114,0.3)', width=1),
-                             fill='tonexty', fillcolor='rgba(250,128,114,0.1)',
-                             showlegend=False), row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['Close'], 
-                             name='Price', line=dict(color='#00D9FF', width=2)), row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['SMA_20'], 
-                             name='SMA 20', line=dict(color='orange', width=1, dash='dash')), row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['SMA_50'], 
-                             name='SMA 50', line=dict(color='red', width=1, dash='dash')), row=1, col=1)
-    
-    fig.add_trace(go.Scatter(x=data.index, y=data['RSI'], 
-                             name='RSI', line=dict(color='purple', width=2)), row=2, col=1)
-    fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5, row=2, col=1)
-    fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=2, col=1)
-    
-    fig.update_layout(height=500, hovermode='x unified', showlegend=True)
-    fig.update_xaxes(showgrid=False)
-    fig.update_yaxes(title_text=info['unit'], row=1, col=1)
-    fig.update_yaxes(title_text="RSI", row=2, col=1)
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("**Trading Signals:**")
-    for signal in signals:
-        st.markdown(f"- {signal}")
-    st.markdown("---")
+# Trends with indicators, grouped by registry category
+for category in dict.fromkeys(info['category'] for info in all_assets.values()):
+    st.markdown(f"**{category}**")
+    for ticker in [t for t, info in all_assets.items() if info['category'] == category]:
+        info = all_assets[ticker]
+        data = technical_data[ticker]
+        
+        # Generate signals
+        signals = generate_signals(data, info['name'])
+        
+        # Create subplot with price and RSI
+        fig = make_subplots(
+            rows=2, cols=1,
+            row_heights=[0.7, 0.3],
+            subplot_titles=(f"{info['emoji']} {info['name']}", "RSI"),
+            vertical_spacing=0.1
+        )
+        
+        # Price chart with Bollinger Bands
+        fig.add_trace(go.Scatter(x=data.index, y=data['BB_upper'], 
+                                 name='BB Upper', line=dict(color='rgba(250,128,114,0.3)', width=1),
+                                 showlegend=False), row=1, col=1)
+        fig.add_trace(go.Scatter(x=data.index, y=data['BB_lower'], 
+                                 name='BB Lower', line=dict(color='rgba(250,128,114,0.3)', width=1),
+                                 fill='tonexty', fillcolor='rgba(250,128,114,0.1)',
+                                 showlegend=False), row=1, col=1)
+        fig.add_trace(go.Scatter(x=data.index, y=data['Close'], 
+                                 name='Price', line=dict(color='#00D9FF', width=2)), row=1, col=1)
+        fig.add_trace(go.Scatter(x=data.index, y=data['SMA_20'], 
+                                 name='SMA 20', line=dict(color='orange', width=1, dash='dash')), row=1, col=1)
+        fig.add_trace(go.Scatter(x=data.index, y=data['SMA_50'], 
+                                 name='SMA 50', line=dict(color='red', width=1, dash='dash')), row=1, col=1)
+        
+        # RSI
+        fig.add_trace(go.Scatter(x=data.index, y=data['RSI'], 
+                                 name='RSI', line=dict(color='purple', width=2)), row=2, col=1)
+        fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5, row=2, col=1)
+        fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=2, col=1)
+        
+        fig.update_layout(height=500, hovermode='x unified', showlegend=True)
+        fig.update_xaxes(showgrid=False)
+        fig.update_yaxes(title_text=info['unit'], row=1, col=1)
+        fig.update_yaxes(title_text="RSI", row=2, col=1)
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Display signals
+        st.markdown("**Trading Signals:**")
+        for signal in signals:
+            st.markdown(f"- {signal}")
+        st.markdown("---")
 
 # Comparison chart
 st.markdown("---")
 st.subheader("🔄 Normalized Price Comparison (% Change from 5 Years Ago)")
 
 with st.spinner('Loading 5-year historical data...'):
-    historical_data = yf.download(tickers, period="5y", progress=False)
+    historical_data = fetch_prices(tickers, "5y")
 
 fig_compare = go.Figure()
 
@@ -540,4 +436,6 @@ fig_compare.update_layout(
 st.plotly_chart(fig_compare, use_container_width=True)
 
 if st.button("🔄 Refresh Prices"):
+    fetch_quotes.clear()
+    fetch_prices.clear()
     st.rerun()
\ No newline at end of file